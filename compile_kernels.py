@@ -0,0 +1,30 @@
+"""
+Ahead-of-time compile the arbitrage kernels into a native extension
+
+Run once with Numba installed:
+
+    python compile_kernels.py
+
+This builds the arb_kernels extension module next to main.py. main.py imports it
+when present, so short runs skip the Numba JIT warmup and Numba is not needed
+at runtime. Rebuild after changing _scan or _step in main.py.
+"""
+import os
+
+from numba.pycc import CC
+
+import main
+
+# Argument types match what ArbitrageBot passes: 1-D float64 price/fee/variation
+# arrays, one [n_coins, n_ex] noise row, and float scalars
+SCAN_SIGNATURE = 'Tuple((i8, i8, i8, f8, f8, f8))(f8[:], f8[:], f8[:], f8[:], f8[:, :], f8)'
+STEP_SIGNATURE = 'Tuple((f8, f8, i8, i8, i8, f8, f8, f8))(f8[:], f8[:], f8[:], f8[:], f8[:, :], f8, f8)'
+
+cc = CC('arb_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('scan', SCAN_SIGNATURE)(main._scan.py_func)
+cc.export('step', STEP_SIGNATURE)(main._step.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,59 +1,190 @@
+import sys
 import time
-import random
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, List, NamedTuple, Tuple, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; the scan falls back to vectorized NumPy
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels still import without Numba"""
+        return lambda func: func
+
+
+# Iterations of random noise drawn per batch, bounding memory on long runs
+NOISE_BLOCK = 10_000
+
+# Risk management: only use 10% of capital per trade
+TRADE_FRACTION = 0.1
+
+# Banner rules, built once instead of on every report
+_EQ80 = "=" * 80
+_DASH80 = "─" * 80
+
+
+@njit(cache=True)
+def _scan(base, buy_mul, sell_mul, vars_, noise, threshold):
+    """
+    Compiled arbitrage scan over every coin and exchange
+    noise holds this iteration's pre-drawn [n_coins, n_ex] uniforms in [-1, 1]
+    Returns: (coin, buy exchange, sell exchange, buy price, sell price, profit %)
+    indices, with coin == -1 when no coin clears the threshold
+    """
+    # Compare net_sell / net_buy ratios cross-multiplied, so no coin needs a division.
+    # The best ratio starts just under the threshold ratio (and never below break-even),
+    # so a single strict comparison also enforces ratio >= threshold
+    best_ns, best_nb = max(1.0, 1.0 + threshold / 100.0 - 1e-12), 1.0
+    best_i, buy_ex, sell_ex = -1, -1, -1
+    best_buy, best_sell = 0.0, 0.0
+    
+    for c in range(base.shape[0]):
+        # Single pass for the lowest (buy) and highest (sell) quote
+        mn, mx = 1e18, -1e18
+        mi, xi = 0, 0
+        for e in range(vars_.shape[0]):
+            p = base[c] * (1.0 + noise[c, e] * vars_[e])
+            if p < mn:
+                mn, mi = p, e
+            if p > mx:
+                mx, xi = p, e
+        
+        # Net prices after fees
+        nb = mn * buy_mul[mi]
+        ns = mx * sell_mul[xi]
+        
+        if ns * best_nb > best_ns * nb:
+            best_ns, best_nb = ns, nb
+            best_i, buy_ex, sell_ex = c, mi, xi
+            best_buy, best_sell = mn, mx
+    
+    # Profit percentage is only needed for the winner
+    best_pct = (best_ns / best_nb - 1.0) * 100.0
+    return best_i, buy_ex, sell_ex, best_buy, best_sell, best_pct
+
+
+@njit(cache=True)
+def _step(base, buy_mul, sell_mul, vars_, noise, capital, threshold):
+    """
+    One fused iteration: _scan plus the trade sizing and profit from execute_trade
+    Returns: (net profit, quantity, coin, buy exchange, sell exchange,
+    buy price, sell price, profit %), with coin == -1 when no trade is made
+    """
+    coin, buy_ex, sell_ex, buy, sell, pct = _scan(base, buy_mul, sell_mul, vars_, noise, threshold)
+    if coin < 0:
+        return 0.0, 0.0, coin, buy_ex, sell_ex, buy, sell, pct
+    
+    quantity = capital * TRADE_FRACTION / buy
+    net_profit = quantity * (sell * sell_mul[sell_ex] - buy * buy_mul[buy_ex])
+    return net_profit, quantity, coin, buy_ex, sell_ex, buy, sell, pct
+
+
+# Prefer the ahead-of-time compiled kernels built by compile_kernels.py: they need
+# neither Numba at runtime nor a JIT warmup on the first iteration
+try:
+    from arb_kernels import scan as _scan_kernel, step as _step_kernel
+    KERNELS_COMPILED = True
+except ImportError:
+    _scan_kernel, _step_kernel = _scan, _step
+    KERNELS_COMPILED = NUMBA_AVAILABLE
 
 
 class Exchange:
-    """Simulates a cryptocurrency exchange with realistic price variations"""
+    """
+    Describes a simulated cryptocurrency exchange (name, fee and price variation)
+    The bot copies these into flat arrays for scanning; quotes are not drawn per exchange
+    """
     
     def __init__(self, name: str, trading_fee: float, price_variation: float):
         self.name = name
         self.trading_fee = trading_fee  # Trading fee as percentage (e.g., 0.1 = 0.1%)
         self.price_variation = price_variation  # How much prices differ from base (0.01 = 1%)
-    
-    def get_price(self, coin: str, base_price: float) -> float:
-        """
-        Get simulated price with exchange-specific variation
-        Each exchange has slightly different prices to create arbitrage opportunities
-        """
-        # Apply exchange-specific variation to base price
-        variation = 1 + random.uniform(-self.price_variation, self.price_variation)
-        return base_price * variation
-    
-    def calculate_fee(self, amount: float) -> float:
-        """Calculate trading fee for a given amount"""
-        return amount * (self.trading_fee / 100)
+
+
+class TradeRecord(NamedTuple):
+    """Details of one executed arbitrage trade (a tuple, so no per-record __dict__)"""
+    timestamp: float  # Epoch seconds; formatted only when displayed
+    coin: str
+    quantity: float
+    buy_exchange: str
+    sell_exchange: str
+    buy_price: float
+    sell_price: float
+    buy_fee: float
+    sell_fee: float
+    total_fees: float
+    net_profit: float
+    profit_pct: float
+    capital_after: float
 
 
 class ArbitrageBot:
     """Simulated arbitrage trading bot for learning and testing strategies"""
     
     def __init__(self, initial_capital: float = 10000):
-        self.capital = initial_capital  # Starting trading capital
+        self.capital = float(initial_capital)  # Starting trading capital (float keeps one kernel signature)
         
         # Initialize exchanges with realistic fee structures and price variations
         # Higher price_variation = more arbitrage opportunities
-        self.exchanges = [
+        self.exchanges = (
             Exchange("Binance", trading_fee=0.1, price_variation=0.015),   # ±1.5% variation
             Exchange("Coinbase", trading_fee=0.5, price_variation=0.02),   # ±2.0% variation
             Exchange("Kraken", trading_fee=0.26, price_variation=0.018),   # ±1.8% variation
             Exchange("Bybit", trading_fee=0.1, price_variation=0.012)      # ±1.2% variation
-        ]
+        )
         
         # Base prices for different cryptocurrencies (simulated market prices)
-        self.base_prices = {
-            'BTC': 45000.0,
-            'ETH': 2500.0,
-            'BNB': 320.0,
-            'SOL': 100.0,
-            'ADA': 0.50,
-            'XRP': 0.60,
-            'DOGE': 0.08,
-            'MATIC': 0.85
-        }
-        
-        self.coins = list(self.base_prices.keys())
+        # Kept as a float64 array parallel to self.coins so market updates are vectorized
+        self.coins = ('BTC', 'ETH', 'BNB', 'SOL', 'ADA', 'XRP', 'DOGE', 'MATIC')
+        self._base_prices = np.array(
+            [45000.0, 2500.0, 320.0, 100.0, 0.50, 0.60, 0.08, 0.85], dtype=np.float64
+        )  # shape [n_coins]
+        self._base_col = self._base_prices[:, None]  # [n_coins, 1] view, tracks in-place updates
+        
+        # Market dimensions, fixed once the coins and exchanges are set
+        self.n_coins = len(self.coins)
+        self.n_ex = len(self.exchanges)
+        
+        # Struct-of-arrays view of the exchanges, indexed by exchange position
+        self.ex_names = tuple(ex.name for ex in self.exchanges)
+        self.ex_fees = np.array([ex.trading_fee for ex in self.exchanges]) / 100  # shape [n_ex]
+        self.ex_vars = np.array([ex.price_variation for ex in self.exchanges])  # shape [n_ex]
+        
+        # Fee multipliers: net buy = price * ex_buy_mul, net sell = price * ex_sell_mul
+        self.ex_buy_mul = 1 + self.ex_fees
+        self.ex_sell_mul = 1 - self.ex_fees
+        
+        # Best-case profit % per (buy, sell) exchange pair: buy at the bottom of the
+        # buy exchange's variation band, sell at the top of the sell exchange's band.
+        # Buying and selling on the same exchange only happens when every quote is
+        # equal, which always loses the fees, so the diagonal is excluded
+        best_sell = (1 + self.ex_vars) * self.ex_sell_mul
+        best_buy = (1 - self.ex_vars) * self.ex_buy_mul
+        self._pair_ub = (best_sell[None, :] / best_buy[:, None] - 1) * 100  # shape [n_ex, n_ex]
+        np.fill_diagonal(self._pair_ub, -np.inf)
+        self._global_ub = float(self._pair_ub.max())
+        
+        # Scratch buffers reused by the NumPy scan so it allocates nothing per iteration
+        n_coins, n_ex = self.n_coins, self.n_ex
+        self._buf_prices = np.empty((n_coins, n_ex))
+        self._buf_buy_idx = np.empty(n_coins, dtype=np.intp)
+        self._buf_sell_idx = np.empty(n_coins, dtype=np.intp)
+        self._buf_buy = np.empty(n_coins)
+        self._buf_sell = np.empty(n_coins)
+        self._buf_nb = np.empty(n_coins)
+        self._buf_ns = np.empty(n_coins)
+        self._buf_r = np.empty(n_coins)
+        
+        # Random noise, drawn lazily in blocks of NOISE_BLOCK iterations
+        self._rng = np.random.default_rng()
+        self._market_noise = None  # shape [NOISE_BLOCK, n_coins]
+        self._ex_noise = None  # shape [NOISE_BLOCK, n_coins, n_ex]
+        self._market_block = -1  # index of the block currently held in _market_noise
+        self._ex_block = -1  # index of the block currently held in _ex_noise
         
         # Trading history and performance tracking
         self.trades = []
@@ -61,71 +192,90 @@ class ArbitrageBot:
         self.successful_trades = 0
         self.failed_trades = 0
     
-    def update_market_prices(self):
+    def update_market_prices(self, i: int):
         """
         Simulate market price movements
         Prices fluctuate slightly each iteration to simulate real market conditions
         """
-        for coin in self.base_prices:
-            # Simulate market movement: ±0.5% per iteration
-            market_change = random.uniform(-0.005, 0.005)
-            self.base_prices[coin] *= (1 + market_change)
+        # Simulate market movement: ±0.5% per iteration for every coin at once
+        self._base_prices *= 1 + self._market_row(i)
     
-    def find_arbitrage_opportunity(self, min_profit_threshold: float = 1.0) -> Optional[Tuple]:
+    def _market_row(self, i: int) -> np.ndarray:
+        """Market drift noise [n_coins] for iteration i, drawn a block at a time"""
+        block, row = divmod(i, NOISE_BLOCK)
+        if block != self._market_block:
+            self._market_noise = self._rng.uniform(-0.005, 0.005, (NOISE_BLOCK, self.n_coins))
+            self._market_block = block
+        return self._market_noise[row]
+    
+    def _ex_row(self, i: int) -> np.ndarray:
+        """Exchange quote noise [n_coins, n_ex] in [-1, 1] for iteration i, drawn a block at a time"""
+        block, row = divmod(i, NOISE_BLOCK)
+        if block != self._ex_block:
+            self._ex_noise = self._rng.uniform(-1, 1, (NOISE_BLOCK, self.n_coins, self.n_ex))
+            self._ex_block = block
+        return self._ex_noise[row]
+    
+    def find_arbitrage_opportunity(self, i: int, min_profit_threshold: float = 1.0) -> Optional[Tuple]:
         """
         Scan all exchanges to find the most profitable arbitrage opportunity
         
         Strategy: Buy low on one exchange, sell high on another
         Returns: Trade details if profitable opportunity found, None otherwise
         """
-        best_opportunity = None
-        best_profit_pct = 0
+        # No exchange pair can reach the threshold, whatever the quotes
+        if self._global_ub < min_profit_threshold:
+            return None
         
-        # Check each coin across all exchanges
-        for coin in self.coins:
-            base_price = self.base_prices[coin]
-            prices = {}
-            
-            # Get current price from each exchange
-            for exchange in self.exchanges:
-                price = exchange.get_price(coin, base_price)
-                prices[exchange.name] = {
-                    'price': price,
-                    'exchange': exchange
-                }
-            
-            # Sort exchanges by price (lowest to highest)
-            sorted_prices = sorted(prices.items(), key=lambda x: x[1]['price'])
-            
-            # Identify buy and sell exchanges
-            buy_exchange = sorted_prices[0][1]['exchange']  # Lowest price
-            sell_exchange = sorted_prices[-1][1]['exchange']  # Highest price
-            buy_price = sorted_prices[0][1]['price']
-            sell_price = sorted_prices[-1][1]['price']
-            
-            # Calculate fees for both transactions
-            buy_fee = buy_exchange.calculate_fee(buy_price)
-            sell_fee = sell_exchange.calculate_fee(sell_price)
-            
-            # Calculate net prices after fees
-            net_buy_price = buy_price + buy_fee
-            net_sell_price = sell_price - sell_fee
-            
-            # Calculate profit percentage after all costs
-            profit_pct = ((net_sell_price - net_buy_price) / net_buy_price) * 100
-            
-            # Update best opportunity if this is more profitable
-            if profit_pct > best_profit_pct and profit_pct >= min_profit_threshold:
-                best_profit_pct = profit_pct
-                best_opportunity = (
-                    coin, buy_exchange, sell_exchange, 
-                    buy_price, sell_price, profit_pct,
-                    buy_fee, sell_fee
-                )
-        
-        return best_opportunity
+        if KERNELS_COMPILED:
+            scan = _scan_kernel(
+                self._base_prices, self.ex_buy_mul, self.ex_sell_mul, self.ex_vars,
+                self._ex_row(i), min_profit_threshold
+            )
+        else:
+            scan = self._scan_numpy(self._ex_row(i), min_profit_threshold)
+        coin_idx, buy_idx, sell_idx, buy_price, sell_price, profit_pct = scan
+        if coin_idx < 0:
+            return None
+        
+        return (
+            self.coins[coin_idx], buy_idx, sell_idx,
+            buy_price, sell_price, profit_pct,
+            buy_price * self.ex_fees[buy_idx], sell_price * self.ex_fees[sell_idx]
+        )
     
-    def execute_trade(self, opportunity: Optional[Tuple]) -> Optional[Dict]:
+    def _scan_numpy(self, noise: np.ndarray, min_profit_threshold: float) -> Tuple:
+        """Vectorized NumPy equivalent of _scan, used when no compiled kernels are available"""
+        # Price matrix [n_coins, n_ex]: every exchange quote for every coin
+        prices = self._buf_prices
+        np.multiply(noise, self.ex_vars, out=prices)
+        prices += 1
+        prices *= self._base_col
+        
+        # Lowest quote is the buy side, highest quote is the sell side (no sort needed)
+        buy_idx = np.argmin(prices, axis=1, out=self._buf_buy_idx)
+        sell_idx = np.argmax(prices, axis=1, out=self._buf_sell_idx)
+        buy = np.min(prices, axis=1, out=self._buf_buy)
+        sell = np.max(prices, axis=1, out=self._buf_sell)
+        
+        # Net prices after fees; the sell/buy ratio ranks coins like profit % does
+        net_buy = np.take(self.ex_buy_mul, buy_idx, out=self._buf_nb)
+        net_buy *= buy
+        net_sell = np.take(self.ex_sell_mul, sell_idx, out=self._buf_ns)
+        net_sell *= sell
+        ratios = np.divide(net_sell, net_buy, out=self._buf_r)
+        
+        # Apply the threshold once to the winner instead of to every coin
+        best = int(ratios.argmax())
+        ratio = ratios[best]
+        if ratio <= max(1.0, 1 + min_profit_threshold / 100 - 1e-12):
+            return -1, -1, -1, 0.0, 0.0, 0.0
+        return (
+            best, int(buy_idx[best]), int(sell_idx[best]),
+            float(buy[best]), float(sell[best]), float((ratio - 1) * 100)
+        )
+    
+    def execute_trade(self, opportunity: Optional[Tuple]) -> Optional[TradeRecord]:
         """
         Execute an arbitrage trade and update portfolio
         Simulates the complete buy/sell process with realistic calculations
@@ -134,10 +284,10 @@ class ArbitrageBot:
             self.failed_trades += 1
             return None
             
-        coin, buy_ex, sell_ex, buy_price, sell_price, profit_pct, buy_fee, sell_fee = opportunity
+        coin, buy_idx, sell_idx, buy_price, sell_price, profit_pct, buy_fee, sell_fee = opportunity
         
         # Risk management: Only use 10% of capital per trade
-        trade_amount = self.capital * 0.1
+        trade_amount = self.capital * TRADE_FRACTION
         quantity = trade_amount / buy_price  # How many coins to buy
         
         # Calculate total costs and revenue
@@ -145,64 +295,104 @@ class ArbitrageBot:
         total_sell_revenue = (sell_price * quantity) - (sell_fee * quantity)
         net_profit = total_sell_revenue - total_buy_cost
         
+        return self._record_trade(
+            coin, buy_idx, sell_idx, buy_price, sell_price, profit_pct, quantity, net_profit
+        )
+    
+    def step(self, i: int, min_profit_threshold: float = 1.0) -> Optional[TradeRecord]:
+        """
+        Find and execute the best arbitrage trade for iteration i
+        With compiled kernels this is a single _step call; otherwise it chains
+        find_arbitrage_opportunity and execute_trade
+        """
+        if not KERNELS_COMPILED:
+            return self.execute_trade(self.find_arbitrage_opportunity(i, min_profit_threshold))
+        
+        # No exchange pair can reach the threshold, whatever the quotes
+        if self._global_ub < min_profit_threshold:
+            self.failed_trades += 1
+            return None
+        
+        net_profit, quantity, coin_idx, buy_idx, sell_idx, buy_price, sell_price, profit_pct = _step_kernel(
+            self._base_prices, self.ex_buy_mul, self.ex_sell_mul, self.ex_vars,
+            self._ex_row(i), self.capital, min_profit_threshold
+        )
+        if coin_idx < 0:
+            self.failed_trades += 1
+            return None
+        return self._record_trade(
+            self.coins[coin_idx], buy_idx, sell_idx, buy_price, sell_price,
+            profit_pct, quantity, net_profit
+        )
+    
+    def _record_trade(self, coin: str, buy_idx: int, sell_idx: int, buy_price: float,
+                      sell_price: float, profit_pct: float, quantity: float,
+                      net_profit: float) -> TradeRecord:
+        """Apply a trade's profit/loss to the portfolio and record it for reporting"""
         # Update capital with profit/loss
         self.capital += net_profit
         self.total_profit += net_profit
         self.successful_trades += 1
         
         # Record trade details for reporting
-        trade_record = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'coin': coin,
-            'quantity': quantity,
-            'buy_exchange': buy_ex.name,
-            'sell_exchange': sell_ex.name,
-            'buy_price': buy_price,
-            'sell_price': sell_price,
-            'buy_fee': buy_fee * quantity,
-            'sell_fee': sell_fee * quantity,
-            'total_fees': (buy_fee + sell_fee) * quantity,
-            'net_profit': net_profit,
-            'profit_pct': profit_pct,
-            'capital_after': self.capital
-        }
+        buy_fee = buy_price * quantity * self.ex_fees[buy_idx]
+        sell_fee = sell_price * quantity * self.ex_fees[sell_idx]
+        trade_record = TradeRecord(
+            timestamp=time.time(),
+            coin=coin,
+            quantity=quantity,
+            buy_exchange=self.ex_names[buy_idx],
+            sell_exchange=self.ex_names[sell_idx],
+            buy_price=buy_price,
+            sell_price=sell_price,
+            buy_fee=buy_fee,
+            sell_fee=sell_fee,
+            total_fees=buy_fee + sell_fee,
+            net_profit=net_profit,
+            profit_pct=profit_pct,
+            capital_after=self.capital
+        )
         
         self.trades.append(trade_record)
         return trade_record
     
-    def print_trade_summary(self, trade: Optional[Dict]):
+    def print_trade_summary(self, trade: Optional[TradeRecord]):
         """Display detailed information about a completed trade"""
         if not trade:
             print("⚠️  No profitable arbitrage opportunity found (below threshold).\n")
             return
             
-        print("=" * 80)
-        print(f"✅ ARBITRAGE TRADE EXECUTED - {trade['timestamp']}")
-        print("=" * 80)
-        print(f"Coin Traded:        {trade['coin']}")
-        print(f"Quantity:           {trade['quantity']:.6f}")
-        print(f"\n📉 BUY ORDER:")
-        print(f"  Exchange:         {trade['buy_exchange']}")
-        print(f"  Price:            ${trade['buy_price']:,.2f}")
-        print(f"  Fee:              ${trade['buy_fee']:,.2f}")
-        print(f"  Total Cost:       ${(trade['buy_price'] * trade['quantity'] + trade['buy_fee']):,.2f}")
-        print(f"\n📈 SELL ORDER:")
-        print(f"  Exchange:         {trade['sell_exchange']}")
-        print(f"  Price:            ${trade['sell_price']:,.2f}")
-        print(f"  Fee:              ${trade['sell_fee']:,.2f}")
-        print(f"  Total Revenue:    ${(trade['sell_price'] * trade['quantity'] - trade['sell_fee']):,.2f}")
-        print(f"\n💰 RESULTS:")
-        print(f"  Total Fees:       ${trade['total_fees']:,.2f}")
-        print(f"  Net Profit/Loss:  ${trade['net_profit']:,.2f} ({trade['profit_pct']:+.2f}%)")
-        print(f"  Capital After:    ${trade['capital_after']:,.2f}")
-        print("=" * 80)
-        print()
+        # Format the whole summary as one string and write it to stdout once
+        timestamp = datetime.fromtimestamp(trade.timestamp).strftime('%Y-%m-%d %H:%M:%S')
+        sys.stdout.write(
+            f"{_EQ80}\n"
+            f"✅ ARBITRAGE TRADE EXECUTED - {timestamp}\n"
+            f"{_EQ80}\n"
+            f"Coin Traded:        {trade.coin}\n"
+            f"Quantity:           {trade.quantity:.6f}\n"
+            f"\n📉 BUY ORDER:\n"
+            f"  Exchange:         {trade.buy_exchange}\n"
+            f"  Price:            ${trade.buy_price:,.2f}\n"
+            f"  Fee:              ${trade.buy_fee:,.2f}\n"
+            f"  Total Cost:       ${(trade.buy_price * trade.quantity + trade.buy_fee):,.2f}\n"
+            f"\n📈 SELL ORDER:\n"
+            f"  Exchange:         {trade.sell_exchange}\n"
+            f"  Price:            ${trade.sell_price:,.2f}\n"
+            f"  Fee:              ${trade.sell_fee:,.2f}\n"
+            f"  Total Revenue:    ${(trade.sell_price * trade.quantity - trade.sell_fee):,.2f}\n"
+            f"\n💰 RESULTS:\n"
+            f"  Total Fees:       ${trade.total_fees:,.2f}\n"
+            f"  Net Profit/Loss:  ${trade.net_profit:,.2f} ({trade.profit_pct:+.2f}%)\n"
+            f"  Capital After:    ${trade.capital_after:,.2f}\n"
+            f"{_EQ80}\n"
+            f"\n"
+        )
     
     def print_overall_summary(self):
         """Display overall trading performance statistics"""
-        print("\n" + "=" * 80)
+        print("\n" + _EQ80)
         print("📊 OVERALL TRADING SUMMARY")
-        print("=" * 80)
+        print(_EQ80)
         print(f"Total Iterations:   {self.successful_trades + self.failed_trades}")
         print(f"Successful Trades:  {self.successful_trades}")
         print(f"Missed Opportunities: {self.failed_trades}")
@@ -218,45 +408,62 @@ class ArbitrageBot:
             avg_profit = self.total_profit / self.successful_trades
             print(f"Avg Profit/Trade:   ${avg_profit:,.2f}")
         
-        print("=" * 80)
+        print(_EQ80)
     
-    def run(self, num_iterations: int = 20, min_profit: float = 1.0):
+    def run(self, num_iterations: int = 20, min_profit: float = 1.0,
+            verbose: bool = True, pacer: Optional[Callable[[], None]] = None):
         """
         Run the simulated arbitrage bot
         
         Args:
             num_iterations: Number of trading cycles to execute
             min_profit: Minimum profit percentage required to execute trade (e.g., 1.0 = 1%)
+            verbose: Print per-iteration progress and trade reports
+            pacer: Called after each iteration to wait for the next price tick
+                   (None returns immediately, for fast backtesting)
         """
-        print("=" * 80)
-        print("🤖 CRYPTO ARBITRAGE TRADING BOT (SIMULATION MODE)")
-        print("=" * 80)
-        print(f"💵 Initial Capital:  ${self.capital:,.2f}")
-        print(f"📊 Min Profit:       {min_profit}%")
-        print(f"🔄 Iterations:       {num_iterations}")
-        print(f"📈 Coins Monitored:  {', '.join(self.coins)}")
-        print(f"🏦 Exchanges:        {', '.join([ex.name for ex in self.exchanges])}")
-        print("=" * 80)
-        print()
-        
-        print("🔍 Starting arbitrage detection...\n")
+        sys.stdout.write(
+            f"{_EQ80}\n"
+            f"🤖 CRYPTO ARBITRAGE TRADING BOT (SIMULATION MODE)\n"
+            f"{_EQ80}\n"
+            f"💵 Initial Capital:  ${self.capital:,.2f}\n"
+            f"📊 Min Profit:       {min_profit}%\n"
+            f"🔄 Iterations:       {num_iterations}\n"
+            f"📈 Coins Monitored:  {', '.join(self.coins)}\n"
+            f"🏦 Exchanges:        {', '.join(self.ex_names)}\n"
+            f"{_EQ80}\n"
+            f"\n"
+            f"🔍 Starting arbitrage detection...\n\n"
+        )
+        
+        # Start each run on fresh noise blocks; exchange quotes are never drawn
+        # when no pair could clear min_profit, since the scan short-circuits first
+        self._market_block = self._ex_block = -1
+        
+        if pacer is None:
+            pacer = lambda: None
+        
+        # Bind hot-loop methods once instead of looking them up every iteration
+        update_market_prices = self.update_market_prices
+        step = self.step
+        print_trade_summary = self.print_trade_summary
+        write = sys.stdout.write
         
         # Main trading loop
         for i in range(num_iterations):
-            print(f"{'─' * 80}")
-            print(f"⏱️  Iteration {i+1}/{num_iterations}")
-            print(f"{'─' * 80}")
+            if verbose:
+                write(f"{_DASH80}\n⏱️  Iteration {i+1}/{num_iterations}\n{_DASH80}\n")
             
             # Simulate market price changes
-            self.update_market_prices()
+            update_market_prices(i)
             
             # Find and execute arbitrage opportunity
-            opportunity = self.find_arbitrage_opportunity(min_profit)
-            trade = self.execute_trade(opportunity)
-            self.print_trade_summary(trade)
+            trade = step(i, min_profit)
+            if verbose:
+                print_trade_summary(trade)
             
-            # Delay between trades (simulate real trading pace)
-            time.sleep(1)
+            # Wait for the next tick (no-op in fast simulation)
+            pacer()
         
         # Display final performance summary
         self.print_overall_summary()
@@ -265,9 +472,9 @@ class ArbitrageBot:
 # ===== MAIN EXECUTION =====
 def main():
     """Main entry point for the arbitrage bot"""
-    print("\n" + "=" * 80)
+    print("\n" + _EQ80)
     print("CRYPTO ARBITRAGE TRADING BOT - SIMULATION MODE")
-    print("=" * 80)
+    print(_EQ80)
     print("\n📝 ABOUT:")
     print("   This bot simulates cryptocurrency arbitrage trading across")
     print("   multiple exchanges. It uses realistic price variations and")
@@ -280,14 +487,15 @@ def main():
     print("\n⚠️  NOTE:")
     print("   This is a SIMULATION for learning purposes.")
     print("   No real money or API connections are involved.")
-    print("=" * 80)
+    print(_EQ80)
     print()
     
     # Initialize bot with $10,000 starting capital
     bot = ArbitrageBot(initial_capital=10000)
     
-    # Run 20 trading iterations with 1% minimum profit threshold
-    bot.run(num_iterations=20, min_profit=1.0)
+    # Run 20 trading iterations with 1% minimum profit threshold,
+    # pacing the demo at one iteration per second to simulate real trading
+    bot.run(num_iterations=20, min_profit=1.0, pacer=lambda: time.sleep(1))
 
 
 if __name__ == "__main__":